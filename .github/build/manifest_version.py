@@ -1,6 +1,6 @@
 import sys
 import os
-import toml
+import tomlkit
 from datetime import datetime
 
 """
@@ -38,14 +38,15 @@ if BUILD_SYSTEM == "devops":
     build_id = build_id.split(".")[1]
 _, cargo_file, version_file = sys.argv
 
-cargo_conf = toml.load(cargo_file)
+with open(cargo_file, "r") as cargo_file_io:
+    cargo_conf = tomlkit.parse(cargo_file_io.read())
 if branch != RELEASE_BRANCH:
     # if it's a release branch, don't touch the TOML - it's fine
     original = cargo_conf["package"]["version"]
-    snapshot = f"{original}-dev{build_date}{build_id.rjust(3,'0')}"
+    snapshot = f"{original}-dev{build_date}{build_id.zfill(3)}"
     cargo_conf["package"]["version"] = snapshot
     with open(cargo_file, "w") as cargo_file_io:
-        toml.dump(cargo_conf, cargo_file_io)
+        cargo_file_io.write(tomlkit.dumps(cargo_conf))
 
 version = cargo_conf["package"]["version"]
 
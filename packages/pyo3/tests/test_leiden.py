@@ -1,25 +1,29 @@
-import os
+import csv
 import graspologic_native as gcn
 import unittest
+from pathlib import Path
 
-sbm_graph = os.path.join("..", "network_partitions", "tests", "sbm_network.csv")
-simple_path = os.path.join("..", "network_partitions", "tests", "simple_org_graph.csv")
+HERE = Path(__file__).resolve().parent
+network_partitions_tests = HERE.parent.parent / "network_partitions" / "tests"
+sbm_graph = network_partitions_tests / "sbm_network.csv"
+simple_path = network_partitions_tests / "simple_org_graph.csv"
 seed = 12345
 
 
 def _get_edges(path):
-  edges = []
-  with open(path, "r") as sbm_graph_io:
-    for line in sbm_graph_io:
-      source, target, weight = line.strip().split(",")
-      edges.append((source, target, float(weight)))
-  return edges
+  with open(path, "r", newline="") as edges_io:
+    return [(source, target, float(weight)) for source, target, weight in csv.reader(edges_io)]
 
 
 class TestLeiden(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.edges = _get_edges(sbm_graph)
+        # seeded, so deterministic; shared by test_leiden and test_reiterative_leiden
+        cls.single_modularity, cls.single_partitions = gcn.leiden(edges=cls.edges, seed=seed)
+
     def test_leiden(self):
-        edges = _get_edges(sbm_graph)
-        modularity, partitions = gcn.leiden(edges=edges, seed=seed)
+        self.assertTrue(len(self.single_partitions) > 0)
 
     def test_reiterative_leiden(self):
         """
@@ -32,14 +36,16 @@ class TestLeiden(unittest.TestCase):
 
         So instead we just test that the modularity and partitions produced where trials=10 is superior
         """
-        edges = _get_edges(sbm_graph)
-        single_modularity, single_partitions = gcn.leiden(edges, seed=seed)
+        repetitive_modularity, repetitive_partitions = gcn.leiden(self.edges, seed=seed, trials=10)
+        self.assertTrue(self.single_modularity < repetitive_modularity)
+
 
-        repetitive_modularity, repetitive_partitions = gcn.leiden(edges, seed=seed, trials=10)
-        self.assertTrue(single_modularity < repetitive_modularity)
+class TestProvidedClusters(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.simple_edges = _get_edges(simple_path)
 
     def test_provided_clusters(self):
-        edges = _get_edges(simple_path)
         # this graph has two connected components, so first we'll try it with a reasonable clustering, and then we'll
         # try it with an invalid clustering
         communities = {
@@ -55,8 +61,8 @@ class TestLeiden(unittest.TestCase):
             "nathan": 1
         }
 
-        gcn.leiden(edges, starting_communities=communities, seed=seed) # we just want to make sure it runs, not
-        # inspect values
+        # we just want to make sure it runs, not inspect values
+        gcn.leiden(self.simple_edges, starting_communities=communities, seed=seed)
 
         # this is a bug we found, and we're testing for it
         communities["dwayne"] = 2
@@ -64,5 +70,5 @@ class TestLeiden(unittest.TestCase):
         # these two have no edges, and shouldn't really be in the same community as per leiden, but they can
         # absolutely be put in there due to other reasons, so we should presume it's possible
 
-        _, partitions = gcn.leiden(edges, starting_communities=communities, seed=seed)
+        _, partitions = gcn.leiden(self.simple_edges, starting_communities=communities, seed=seed)
         self.assertNotEqual(partitions["dwayne"], partitions["nathan"])